@@ -12,31 +12,68 @@ Ollama-like shape.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import http.client
+import io
+import itertools
 import json
 import os
+import queue
+import sqlite3
 import ssl
 import subprocess
+import sys
 import threading
 import time
-import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from typing import Any
+from typing import Any, AnyStr, Callable, Iterator
 from urllib import error as urlerror
 from urllib import request as urlrequest
+from urllib.parse import urlsplit
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used when missing
+    orjson = None
+
 
 DEFAULT_PORT = int(os.environ.get("BRIDGE_PORT", "11435"))
+BRIDGE_WORKERS = max(1, int(os.environ.get("BRIDGE_WORKERS", "32")))
+BRIDGE_MAX_PENDING = max(0, int(os.environ.get("BRIDGE_MAX_PENDING", "64")))
+BRIDGE_MAX_BODY_BYTES = int(os.environ.get("BRIDGE_MAX_BODY_BYTES", str(4 * 1024 * 1024)))
+REQUEST_BODY_READ_CHUNK_BYTES = 1 << 16
+BRIDGE_READ_TIMEOUT_SECONDS = float(os.environ.get("BRIDGE_READ_TIMEOUT_SECONDS", "30"))
+BRIDGE_KEEPALIVE_TIMEOUT_SECONDS = float(os.environ.get("BRIDGE_KEEPALIVE_TIMEOUT_SECONDS", "5"))
 CODEX_BIN = os.environ.get("CODEX_BIN", "codex")
 GEMINI_BIN = os.environ.get("GEMINI_BIN", "gemini")
 GEMINI_API_BASE_URL = os.environ.get("GEMINI_API_BASE_URL", "https://generativelanguage.googleapis.com/v1beta")
+GEMINI_POOL_SIZE = max(0, int(os.environ.get("GEMINI_POOL_SIZE", "16")))
+GEMINI_SSL_VERIFY = os.environ.get("GEMINI_SSL_VERIFY", "1").strip().lower() not in {"0", "false", "no", "off"}
 CODEX_TIMEOUT_SECONDS = int(os.environ.get("CODEX_TIMEOUT_SECONDS", "120"))
+BRIDGE_KILL_GRACE_SECONDS = max(0.0, float(os.environ.get("BRIDGE_KILL_GRACE_SECONDS", "2")))
+BRIDGE_STREAM_FLUSH_EVERY = max(1, int(os.environ.get("BRIDGE_STREAM_FLUSH_EVERY", "1")))
+BRIDGE_STREAM_FLUSH_BYTES = max(1, int(os.environ.get("BRIDGE_STREAM_FLUSH_BYTES", "4096")))
+BRIDGE_STREAM_REPLAY_CHARS = max(1, int(os.environ.get("BRIDGE_STREAM_REPLAY_CHARS", "256")))
+BRIDGE_STREAM_DELAY_MS = max(0, int(os.environ.get("BRIDGE_STREAM_DELAY_MS", "0")))
+CODEX_POOL_SIZE = int(os.environ.get("CODEX_POOL_SIZE", "2"))
+CODEX_POOL_MAX_IDLE_SECONDS = float(os.environ.get("CODEX_POOL_MAX_IDLE_SECONDS", "600"))
+CODEX_WORKER_CWD = os.path.expanduser(os.environ.get("CODEX_WORKER_CWD", "").strip())
 STARTUP_CHECK_TIMEOUT_SECONDS = int(os.environ.get("STARTUP_CHECK_TIMEOUT_SECONDS", "15"))
 STARTUP_CHECK_STRICT = os.environ.get("STARTUP_CHECK_STRICT", "0").strip().lower() in {"1", "true", "yes", "on"}
+STARTUP_PROBE_SKIP = os.environ.get("STARTUP_PROBE_SKIP", "0").strip().lower() in {"1", "true", "yes", "on"}
+BRIDGE_CACHE_TTL = int(os.environ.get("BRIDGE_CACHE_TTL", "3600"))
+BRIDGE_MAX_PARALLEL_CODEX = max(1, int(os.environ.get("BRIDGE_MAX_PARALLEL_CODEX", str(max(4, os.cpu_count() or 4)))))
+BRIDGE_CODEX_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("BRIDGE_CODEX_QUEUE_TIMEOUT_SECONDS", "10"))
+BRIDGE_RETRY_AFTER_SECONDS = max(1, int(os.environ.get("BRIDGE_RETRY_AFTER_SECONDS", "1")))
+BRIDGE_CACHE_SIZE = max(0, int(os.environ.get("BRIDGE_CACHE_SIZE", "512")))
 CODEX_MODEL = os.environ.get("CODEX_MODEL", "").strip()
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "").strip()
 CODEX_MODEL_VERBOSITY = os.environ.get("CODEX_MODEL_VERBOSITY", "high").strip().lower()
@@ -46,15 +83,32 @@ DETAIL_SYSTEM_INSTRUCTION = os.environ.get(
     "DETAIL_SYSTEM_INSTRUCTION",
     "Always respond in the user's language environment and match the language used in the user's request unless explicitly asked otherwise. Respond naturally and conversationally. Prefer flowing prose and avoid forced numbered or bullet lists unless the user explicitly asks for list format. Give enough detail to be useful while keeping the flow smooth and readable.",
 ).strip()
+DETAIL_SYSTEM_LINE = f"[SYSTEM] {DETAIL_SYSTEM_INSTRUCTION}" if DETAIL_MODE != "off" and DETAIL_SYSTEM_INSTRUCTION else ""
 
 KST = ZoneInfo("Asia/Seoul")
 LOG_DIR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 SETTINGS_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bridge_settings.json")
 SECRETS_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bridge_secrets.json")
+CACHE_DIR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bridge_cache")
+CACHE_DB_FILE_PATH = os.path.join(CACHE_DIR_PATH, "responses.sqlite3")
 active_log_file_path = ""
-LOG_FILE_LOCK = threading.Lock()
+LOG_QUEUE: queue.Queue[str | None] = queue.Queue()
+LOG_WRITER_BUFFER_BYTES = 1 << 16
+log_writer_thread: threading.Thread | None = None
 CONSOLE_LOG_VALUE_MAX_CHARS = 200
+LOG_LEVELS = {"debug": 10, "info": 20, "error": 40, "off": 100}
+BRIDGE_LOG_LEVEL = LOG_LEVELS.get(os.environ.get("BRIDGE_LOG_LEVEL", "info").strip().lower(), LOG_LEVELS["info"])
+BRIDGE_LOG_PRETTY = os.environ.get("BRIDGE_LOG_PRETTY", "0").strip().lower() in {"1", "true", "yes", "on"}
+LOG_ERROR_EVENT_SUFFIXES = (".error", ".aborted", ".read_timeout", ".invalid_json", ".rejected")
+RESPONSE_CACHE_LOCK = threading.Lock()
+RESPONSE_DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RESPONSE_DISK_CACHE_LOCK = threading.Lock()
 gemini_auth_mode = "google"
+CODEX_SLOTS = threading.BoundedSemaphore(BRIDGE_MAX_PARALLEL_CODEX)
+
+
+class BridgeBusyError(RuntimeError):
+    pass
 
 
 def resolve_gemini_model_name(requested_model: str) -> str:
@@ -76,34 +130,133 @@ def resolve_codex_model_name(requested_model: str) -> str:
 
 
 def build_gemini_ssl_context() -> ssl.SSLContext:
+    if GEMINI_SSL_VERIFY:
+        return ssl.create_default_context()
     return ssl._create_unverified_context()  # noqa: SLF001
 
 
-@dataclass
+GEMINI_SSL_CONTEXT = build_gemini_ssl_context()
+
+
+@dataclass(slots=True)
 class BridgeResult:
     text: str
-    raw_events: list[dict[str, Any]]
+    cache_hit: bool = False
+
+
+response_cache: OrderedDict[str, tuple[float, BridgeResult]] = OrderedDict()
+response_disk_cache: sqlite3.Connection | None = None
+
+
+KST_OFFSET_SECONDS = int(datetime.now(KST).utcoffset().total_seconds())
+KST_OFFSET_SUFFIX = "{}{:02d}:{:02d}".format(
+    "+" if KST_OFFSET_SECONDS >= 0 else "-",
+    abs(KST_OFFSET_SECONDS) // 3600,
+    abs(KST_OFFSET_SECONDS) % 3600 // 60,
+)
+now_iso_cache: tuple[int, str] = (-1, "")
 
 
 def now_iso() -> str:
-    return datetime.now(KST).isoformat(timespec="microseconds")
+    # Korea has no DST, so the offset is fixed; the seconds part is formatted
+    # once per second and only the microseconds change between calls.
+    global now_iso_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = now_iso_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds + KST_OFFSET_SECONDS))
+        now_iso_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}{KST_OFFSET_SUFFIX}"
+
+
+def log_writer_loop(log_file_path: str) -> None:
+    # Keep draining the queue when the file cannot be written (disk full, removed
+    # directory); otherwise the queue would grow without bound. Failures go to stderr
+    # once per streak, since console output does not depend on the file.
+    fp = None
+    failing = False
+    try:
+        fp = open(log_file_path, "a", encoding="utf-8", buffering=LOG_WRITER_BUFFER_BYTES)
+    except OSError as exc:
+        print(f"[{now_iso()}] Log file unavailable, file logging disabled: {exc}", file=sys.stderr)
+    while True:
+        text = LOG_QUEUE.get()
+        if text is None:
+            break
+        if fp is None:
+            continue
+        try:
+            fp.write(text)
+            if LOG_QUEUE.empty():
+                fp.flush()
+            failing = False
+        except OSError as exc:
+            if not failing:
+                print(f"[{now_iso()}] Log file write failed, dropping log lines: {exc}", file=sys.stderr)
+                failing = True
+    if fp is not None:
+        try:
+            fp.close()
+        except OSError:
+            pass
 
 
-def append_log_text(text: str) -> None:
+def start_log_writer() -> None:
+    global log_writer_thread
+    if log_writer_thread is not None:
+        return
     log_file_path = active_log_file_path
     if not log_file_path:
         os.makedirs(LOG_DIR_PATH, exist_ok=True)
         fallback_name = datetime.now(KST).strftime("bridge_server-%Y%m%d-%H%M%S.log")
         log_file_path = os.path.join(LOG_DIR_PATH, fallback_name)
-    with LOG_FILE_LOCK:
-        with open(log_file_path, "a", encoding="utf-8") as fp:
-            fp.write(text)
-            if not text.endswith("\n"):
-                fp.write("\n")
+    thread = threading.Thread(target=log_writer_loop, args=(log_file_path,), name="bridge-log-writer", daemon=True)
+    thread.start()
+    log_writer_thread = thread
+
+
+def stop_log_writer() -> None:
+    if log_writer_thread is None:
+        return
+    LOG_QUEUE.put(None)
+    log_writer_thread.join(timeout=5)
+
+
+atexit.register(stop_log_writer)
+
+
+# Without orjson, one compact encoder is reused; its output matches orjson's.
+JSON_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def json_dumps_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return JSON_COMPACT_ENCODER.encode(payload).encode("utf-8")
+
+
+def json_dumps_pretty(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def json_loads(data: bytes | bytearray | str) -> Any:
+    # Both parsers accept raw bytes, so request bodies are never decoded into a
+    # second str copy first.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def append_log_text(text: str) -> None:
+    if log_writer_thread is None:
+        start_log_writer()
+    LOG_QUEUE.put(text if text.endswith("\n") else text + "\n")
 
 
 def log_line(text: str) -> None:
-    print(text, flush=True)
+    print(text)
     append_log_text(text)
 
 
@@ -116,119 +269,478 @@ def truncate_text(value: str, max_chars: int) -> str:
 
 
 def truncate_for_console(value: Any, max_chars: int) -> Any:
+    # Copy-on-write: untouched values are returned as-is, and only containers
+    # that hold a truncated string are copied.
     if isinstance(value, str):
         return truncate_text(value, max_chars)
     if isinstance(value, dict):
-        return {k: truncate_for_console(v, max_chars) for k, v in value.items()}
-    if isinstance(value, list):
-        return [truncate_for_console(item, max_chars) for item in value]
-    if isinstance(value, tuple):
-        return [truncate_for_console(item, max_chars) for item in value]
+        copied: dict[Any, Any] | None = None
+        for key, item in value.items():
+            truncated = truncate_for_console(item, max_chars)
+            if truncated is not item:
+                if copied is None:
+                    copied = dict(value)
+                copied[key] = truncated
+        return value if copied is None else copied
+    if isinstance(value, (list, tuple)):
+        copied_items: list[Any] | None = None
+        for index, item in enumerate(value):
+            truncated = truncate_for_console(item, max_chars)
+            if truncated is not item:
+                if copied_items is None:
+                    copied_items = list(value)
+                copied_items[index] = truncated
+        if copied_items is None:
+            return value
+        return tuple(copied_items) if isinstance(value, tuple) else copied_items
     return value
 
 
-def chunk_text(text: str, chunk_size: int = 40) -> list[str]:
-    if not text:
-        return [""]
-    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+def iter_text_chunks(text: str, target_chars: int) -> Iterator[str]:
+    # Splits on "\n" only, merging consecutive lines while they fit in
+    # target_chars; a single longer line is yielded whole.
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start) + 1 or length
+        while end < length:
+            next_end = text.find("\n", end) + 1 or length
+            if next_end - start > target_chars:
+                break
+            end = next_end
+        yield text[start:end]
+        start = end
 
 
 def build_prompt_from_messages(messages: list[dict[str, Any]]) -> str:
-    lines: list[str] = []
-    if DETAIL_MODE != "off" and DETAIL_SYSTEM_INSTRUCTION:
-        lines.append(f"[SYSTEM] {DETAIL_SYSTEM_INSTRUCTION}")
+    buf = io.StringIO()
+    if DETAIL_SYSTEM_LINE:
+        buf.write(DETAIL_SYSTEM_LINE)
+        buf.write("\n")
     for msg in messages:
-        role = str(msg.get("role", "user")).upper()
-        content = str(msg.get("content", ""))
-        lines.append(f"[{role}] {content}")
-    lines.append("\nAnswer as the assistant only.")
-    return "\n".join(lines)
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+        buf.write("[")
+        buf.write(role.upper() if isinstance(role, str) else str(role).upper())
+        buf.write("] ")
+        buf.write(content if isinstance(content, str) else str(content))
+        buf.write("\n")
+    buf.write("\nAnswer as the assistant only.")
+    return buf.getvalue()
+
+
+def build_prompt_from_generate(prompt: str, system: str) -> str:
+    prefix = DETAIL_SYSTEM_LINE + "\n" if DETAIL_SYSTEM_LINE else ""
+    if system:
+        return f"{prefix}[SYSTEM] {system}\n[USER] {prompt}"
+    return f"{prefix}[USER] {prompt}"
 
 
-def run_codex(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> BridgeResult:
+def build_codex_command(codex_model: str) -> tuple[str, ...]:
     cmd = [CODEX_BIN, "exec", "--skip-git-repo-check", "--json"]
-    codex_model = resolve_codex_model_name(requested_model)
     if codex_model:
         cmd.extend(["--model", codex_model])
     if CODEX_MODEL_VERBOSITY in {"low", "medium", "high"}:
         cmd.extend(["-c", f'model_verbosity="{CODEX_MODEL_VERBOSITY}"'])
     cmd.append("-")
+    return tuple(cmd)
+
+
+CODEX_DEFAULT_COMMAND = build_codex_command(CODEX_MODEL)
+
 
+def build_codex_env() -> dict[str, str]:
     env = os.environ.copy()
     env.setdefault("CI", "true")
     env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    return env
+
+
+def build_gemini_cli_env() -> dict[str, str]:
+    env = os.environ.copy()
+    env.pop("CI", None)
+    env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    env.pop("GEMINI_API_KEY", None)
+    env.pop("GOOGLE_API_KEY", None)
+    env["GOOGLE_GENAI_USE_GCA"] = "true"
+    return env
+
+
+# Child environments are built once; call refresh_subprocess_envs() after changing os.environ.
+codex_env = build_codex_env()
+gemini_cli_env = build_gemini_cli_env()
+
 
-    proc = subprocess.run(
+def refresh_subprocess_envs() -> None:
+    global codex_env, gemini_cli_env
+    codex_env = build_codex_env()
+    gemini_cli_env = build_gemini_cli_env()
+
+
+def spawn_codex_process(cmd: tuple[str, ...]) -> subprocess.Popen[bytes]:
+    # Binary pipes: event lines are filtered and parsed as bytes, never decoded whole.
+    return subprocess.Popen(
         cmd,
-        input=prompt,
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        timeout=timeout_seconds if timeout_seconds is not None else CODEX_TIMEOUT_SECONDS,
-        check=False,
-        env=env,
+        env=codex_env,
+        cwd=CODEX_WORKER_CWD or None,
     )
 
-    events: list[dict[str, Any]] = []
-    for line in proc.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
+
+class CodexWorkerPool:
+    """Keeps `codex exec` processes for the default model spawned and waiting on stdin.
+
+    `codex exec` answers one prompt per process, so a worker is handed out once
+    and a replacement is spawned in the background. This moves process startup
+    off the request path. Workers that died or sat idle longer than
+    `max_idle_seconds` are discarded instead of handed out.
+    """
+
+    def __init__(self, size: int, max_idle_seconds: float) -> None:
+        self.size = max(0, size)
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: queue.Queue[tuple[float, subprocess.Popen[bytes]]] = queue.Queue()
+        self._started = False
+
+    def start(self) -> None:
+        if self.size <= 0 or self._started:
+            return
+        self._started = True
+        for _ in range(self.size):
+            self._refill()
+
+    def acquire(self) -> subprocess.Popen[bytes]:
+        while self._started:
+            try:
+                spawned_at, proc = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            threading.Thread(target=self._refill, daemon=True).start()
+            if proc.poll() is not None:
+                continue
+            if self.max_idle_seconds > 0 and time.monotonic() - spawned_at > self.max_idle_seconds:
+                threading.Thread(target=stop_process, args=(proc,), daemon=True).start()
+                continue
+            return proc
+        return spawn_codex_process(CODEX_DEFAULT_COMMAND)
+
+    def close(self) -> None:
+        self._started = False
+        while True:
+            try:
+                _, proc = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            proc.kill()
+            proc.wait()
+
+    def _refill(self) -> None:
+        if not self._started:
+            return
         try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
+            self._idle.put((time.monotonic(), spawn_codex_process(CODEX_DEFAULT_COMMAND)))
+        except OSError:
+            return
 
-    if proc.returncode != 0:
-        err = proc.stderr.strip() or "codex exec failed"
-        raise RuntimeError(err)
 
-    answer = ""
-    for ev in events:
-        if ev.get("type") != "item.completed":
+codex_pool = CodexWorkerPool(CODEX_POOL_SIZE, CODEX_POOL_MAX_IDLE_SECONDS)
+atexit.register(codex_pool.close)
+
+
+def stop_process(proc: subprocess.Popen[Any]) -> None:
+    # SIGTERM first so the CLI can clean up its own children, then SIGKILL.
+    if proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=BRIDGE_KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def iter_process_lines(
+    proc: subprocess.Popen[AnyStr],
+    timeout: float,
+    failure_message: str,
+    input_data: AnyStr | None = None,
+) -> Iterator[AnyStr]:
+    """Yields stdout lines of a running process as they are written.
+
+    Raises after the last line when the process fails or runs past `timeout`.
+    Closing the generator early kills the process.
+    """
+    assert proc.stdout is not None and proc.stderr is not None
+    timed_out = threading.Event()
+
+    def kill_on_timeout() -> None:
+        timed_out.set()
+        stop_process(proc)
+
+    stderr_parts: list[AnyStr] = []
+    stderr_reader = threading.Thread(target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True)
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.daemon = True
+    stderr_reader.start()
+    timer.start()
+    try:
+        if input_data is not None and proc.stdin is not None:
+            try:
+                proc.stdin.write(input_data)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        yield from proc.stdout
+
+        proc.wait()
+        stderr_reader.join()
+    finally:
+        timer.cancel()
+        stop_process(proc)
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    if proc.returncode != 0:
+        err = stderr_parts[0] if stderr_parts else ""
+        if isinstance(err, bytes):
+            err = err.decode("utf-8", "replace")
+        raise RuntimeError(err.strip() or failure_message)
+
+
+def stream_codex(
+    prompt: str,
+    requested_model: str,
+    timeout_seconds: int | None = None,
+    log_context: dict[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    codex_model = resolve_codex_model_name(requested_model)
+    if not CODEX_SLOTS.acquire(timeout=max(0.0, BRIDGE_CODEX_QUEUE_TIMEOUT_SECONDS)):
+        raise BridgeBusyError(f"Too many codex requests in flight (limit {BRIDGE_MAX_PARALLEL_CODEX})")
+    try:
+        if codex_model == CODEX_MODEL:
+            proc = codex_pool.acquire()
+        else:
+            proc = spawn_codex_process(build_codex_command(codex_model))
+
+        timeout = timeout_seconds if timeout_seconds is not None else CODEX_TIMEOUT_SECONDS
+        log_events = BRIDGE_LOG_LEVEL <= LOG_LEVELS["debug"]
+        # Only agent message events carry answer text, so other lines are not parsed.
+        for line in iter_process_lines(proc, timeout, "codex exec failed", input_data=prompt.encode("utf-8")):
+            if log_events:
+                raw_line = line.decode("utf-8", "replace").rstrip("\n")
+                log_json_event(
+                    {"ts": now_iso(), **(log_context or {}), "event": "codex.event", "line": raw_line},
+                    LOG_LEVELS["debug"],
+                )
+            if b'"agent_message"' not in line and b'"agentMessage"' not in line:
+                continue
+            try:
+                yield json_loads(line)
+            except ValueError:
+                continue
+    finally:
+        CODEX_SLOTS.release()
+
+
+def iter_codex_text_deltas(events: Iterator[dict[str, Any]]) -> Iterator[str]:
+    """Turns agent_message events into the text each one adds.
+
+    This is what streaming sends: every agent message, separated by a blank
+    line. Items without an id are treated as new messages. Non-streaming
+    answers use only the last message (see run_codex).
+    """
+    seen: dict[str | int, str] = {}
+    emitted: set[str | int] = set()
+    for index, ev in enumerate(events):
+        if ev.get("type") not in {"item.updated", "item.completed"}:
             continue
         item = ev.get("item", {})
-        if item.get("type") in {"agent_message", "agentMessage"}:
-            answer = str(item.get("text", ""))
+        if item.get("type") not in {"agent_message", "agentMessage"}:
+            continue
+        item_key: str | int = str(item.get("id") or "") or index
+        text = str(item.get("text", ""))
+        previous = seen.get(item_key, "")
+        seen[item_key] = text
+        if not text.startswith(previous):
+            # Already-sent text cannot be taken back; keep what was streamed.
+            continue
+        piece = text[len(previous) :]
+        if not piece:
+            continue
+        # The separator goes before an item's first non-empty piece, which may
+        # arrive after updates that carried no text yet.
+        if item_key not in emitted:
+            if emitted:
+                piece = "\n\n" + piece
+            emitted.add(item_key)
+        yield piece
+
+
+def codex_agent_message_text(event: dict[str, Any]) -> str | None:
+    if event.get("type") != "item.completed":
+        return None
+    item = event.get("item", {})
+    if item.get("type") in {"agent_message", "agentMessage"}:
+        return str(item.get("text", ""))
+    return None
+
+
+def run_codex(
+    prompt: str,
+    requested_model: str,
+    timeout_seconds: int | None = None,
+    log_context: dict[str, Any] | None = None,
+) -> BridgeResult:
+    answer = ""
+    for ev in stream_codex(prompt, requested_model, timeout_seconds=timeout_seconds, log_context=log_context):
+        text = codex_agent_message_text(ev)
+        if text is not None:
+            answer = text
 
     if not answer:
         raise RuntimeError("No assistant message found in codex output")
 
-    return BridgeResult(text=answer, raw_events=events)
+    return BridgeResult(text=answer)
 
 
-def run_gemini_cli(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> BridgeResult:
+def stream_gemini_cli(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> Iterator[str]:
     cmd = [GEMINI_BIN, "--prompt", prompt]
     gemini_model = resolve_gemini_model_name(requested_model)
     if gemini_model:
         cmd.extend(["--model", gemini_model])
 
-    env = os.environ.copy()
-    env.pop("CI", None)
-    env.setdefault("GIT_TERMINAL_PROMPT", "0")
-    env.pop("GEMINI_API_KEY", None)
-    env.pop("GOOGLE_API_KEY", None)
-    env["GOOGLE_GENAI_USE_GCA"] = "true"
-
-    proc = subprocess.run(
+    proc = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
-        timeout=timeout_seconds if timeout_seconds is not None else CODEX_TIMEOUT_SECONDS,
-        check=False,
-        env=env,
+        env=gemini_cli_env,
     )
+    timeout = timeout_seconds if timeout_seconds is not None else CODEX_TIMEOUT_SECONDS
+
+    # Leading and trailing whitespace is held back so the pieces join to stdout.strip().
+    started = False
+    pending = ""
+    for line in iter_process_lines(proc, timeout, "gemini cli call failed"):
+        if not started:
+            line = line.lstrip()
+            if not line:
+                continue
+            started = True
+        text = pending + line
+        piece = text.rstrip()
+        pending = text[len(piece) :]
+        if piece:
+            yield piece
 
-    if proc.returncode != 0:
-        err = proc.stderr.strip() or "gemini cli call failed"
-        raise RuntimeError(err)
 
-    answer = proc.stdout.strip()
+def run_gemini_cli(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> BridgeResult:
+    answer = "".join(stream_gemini_cli(prompt, requested_model, timeout_seconds=timeout_seconds))
     if not answer:
         raise RuntimeError("No assistant message found in gemini output")
 
-    return BridgeResult(text=answer, raw_events=[])
+    return BridgeResult(text=answer)
+
+
+class HTTPConnectionPool:
+    """Reuses keep-alive HTTP(S) connections per host.
+
+    At most `max_idle_per_host` idle connections are kept per host. Hosts
+    reached through a configured proxy fall back to `urllib.request`.
+    """
+
+    def __init__(self, max_idle_per_host: int, ssl_context: ssl.SSLContext) -> None:
+        self.max_idle_per_host = max_idle_per_host
+        self.ssl_context = ssl_context
+        self._idle: dict[tuple[str, str, int], deque[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        if urlrequest.getproxies().get(scheme) and not urlrequest.proxy_bypass(host):
+            return self._request_via_urllib(method, url, body, headers, timeout)
+
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request_headers = {**headers, "Connection": "keep-alive"}
+
+        for attempt in range(2):
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return resp.status, data
+        raise RuntimeError("unreachable")
+
+    def _acquire(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _request_via_urllib(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, bytes]:
+        req = urlrequest.Request(url, data=body, headers=headers, method=method)
+        try:
+            with urlrequest.urlopen(req, timeout=timeout, context=self.ssl_context) as resp:
+                return resp.status, resp.read()
+        except urlerror.HTTPError as exc:
+            return exc.code, exc.read() if exc.fp else str(exc).encode("utf-8")
+        except urlerror.URLError as exc:
+            raise OSError(str(exc.reason)) from exc
+
+
+gemini_http_pool = HTTPConnectionPool(GEMINI_POOL_SIZE, GEMINI_SSL_CONTEXT)
 
 
 def run_gemini_api(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> BridgeResult:
@@ -248,26 +760,24 @@ def run_gemini_api(prompt: str, requested_model: str, timeout_seconds: int | Non
             }
         ]
     }
-    payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
-    req = urlrequest.Request(
-        endpoint,
-        data=payload,
-        headers={"Content-Type": "application/json; charset=utf-8"},
-        method="POST",
-    )
+    payload = json_dumps_bytes(body)
 
     timeout = timeout_seconds if timeout_seconds is not None else CODEX_TIMEOUT_SECONDS
-    ssl_context = build_gemini_ssl_context()
     try:
-        with urlrequest.urlopen(req, timeout=timeout, context=ssl_context) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace") if exc.fp else str(exc)
-        raise RuntimeError(f"gemini api call failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise RuntimeError(f"gemini api call failed: {exc.reason}") from exc
-
-    parsed = json.loads(raw)
+        status, raw_bytes = gemini_http_pool.request(
+            "POST",
+            endpoint,
+            body=payload,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            timeout=timeout,
+        )
+    except (OSError, http.client.HTTPException) as exc:
+        raise RuntimeError(f"gemini api call failed: {exc}") from exc
+    if status >= 400:
+        raise RuntimeError(f"gemini api call failed ({status}): {raw_bytes.decode('utf-8', errors='replace')}")
+
+    raw = raw_bytes.decode("utf-8", errors="replace")
+    parsed = json_loads(raw_bytes)
     candidates = parsed.get("candidates", [])
     if not isinstance(candidates, list) or not candidates:
         raise RuntimeError(f"gemini api returned no candidates: {raw}")
@@ -282,7 +792,7 @@ def run_gemini_api(prompt: str, requested_model: str, timeout_seconds: int | Non
     answer = "\n".join(text_parts).strip()
     if not answer:
         raise RuntimeError(f"gemini api returned empty text: {raw}")
-    return BridgeResult(text=answer, raw_events=[])
+    return BridgeResult(text=answer)
 
 
 def run_gemini(prompt: str, requested_model: str, timeout_seconds: int | None = None) -> BridgeResult:
@@ -302,17 +812,217 @@ def resolve_runner(model_name: str) -> tuple[str, str]:
     raise ValueError("model must start with 'codex' or 'gemini'")
 
 
-def run_model(model_name: str, prompt: str, timeout_seconds: int | None = None) -> BridgeResult:
+def response_cache_key(runner: str, resolved_model: str, prompt: str, stream: bool = False) -> str:
+    # Key on the model the CLI will actually run, so changing CODEX_MODEL/GEMINI_MODEL
+    # or the Gemini auth mode does not serve answers persisted by a previous setup.
+    # Streamed codex answers hold every agent message, non-streamed ones only the
+    # last, so the two are cached apart.
+    if runner == "codex":
+        mode = "stream" if stream else "final"
+        effective = f"{resolve_codex_model_name(resolved_model)}|{CODEX_MODEL_VERBOSITY}|{mode}"
+    else:
+        effective = f"{resolve_gemini_model_name(resolved_model)}|{gemini_auth_mode}"
+    raw = f"{runner}|{effective}|{prompt}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def open_response_disk_cache() -> sqlite3.Connection:
+    os.makedirs(CACHE_DIR_PATH, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB_FILE_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL, stored_at REAL NOT NULL)"
+    )
+    conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+    return conn
+
+
+def response_disk_cache_get(key: str) -> tuple[float, BridgeResult] | None:
+    if response_disk_cache is None:
+        return None
+    try:
+        with RESPONSE_DISK_CACHE_LOCK:
+            row = response_disk_cache.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None or row[1] <= time.time():
+        return None
+    try:
+        loaded = json_loads(row[0])
+    except json.JSONDecodeError:
+        return None
+    return row[1], BridgeResult(text=str(loaded.get("text", "")))
+
+
+def response_disk_cache_put(key: str, result: BridgeResult, expires_at: float) -> None:
+    if response_disk_cache is None:
+        return
+    payload = json_dumps_bytes({"text": result.text}).decode("utf-8")
+    try:
+        with RESPONSE_DISK_CACHE_LOCK:
+            response_disk_cache.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, time.time()),
+            )
+            # Live database pages; cheap compared to summing every payload on each insert.
+            used_pages = (
+                response_disk_cache.execute("PRAGMA page_count").fetchone()[0]
+                - response_disk_cache.execute("PRAGMA freelist_count").fetchone()[0]
+            )
+            total_bytes = used_pages * response_disk_cache.execute("PRAGMA page_size").fetchone()[0]
+            if total_bytes > RESPONSE_DISK_CACHE_MAX_BYTES:
+                response_disk_cache.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY stored_at LIMIT "
+                    "(SELECT COUNT(*) / 4 + 1 FROM responses))"
+                )
+    except sqlite3.Error:
+        return
+
+
+def response_cache_get(key: str) -> BridgeResult | None:
+    with RESPONSE_CACHE_LOCK:
+        entry = response_cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.time():
+                response_cache.move_to_end(key)
+                return result
+            del response_cache[key]
+
+    stored = response_disk_cache_get(key)
+    if stored is None:
+        return None
+    expires_at, result = stored
+    response_cache_put(key, result, persist=False, expires_at=expires_at)
+    return result
+
+
+def response_cache_put(
+    key: str,
+    result: BridgeResult,
+    persist: bool = True,
+    expires_at: float | None = None,
+) -> None:
+    if expires_at is None:
+        expires_at = time.time() + BRIDGE_CACHE_TTL
+    stored = BridgeResult(text=result.text)
+    with RESPONSE_CACHE_LOCK:
+        response_cache[key] = (expires_at, stored)
+        response_cache.move_to_end(key)
+        while len(response_cache) > BRIDGE_CACHE_SIZE:
+            response_cache.popitem(last=False)
+    if persist:
+        response_disk_cache_put(key, stored, expires_at)
+
+
+def cache_status(result: BridgeResult, use_cache: bool) -> str:
+    if result.cache_hit:
+        return "hit"
+    if use_cache and BRIDGE_CACHE_TTL > 0:
+        return "miss"
+    return "off"
+
+
+def run_model(
+    model_name: str,
+    prompt: str,
+    timeout_seconds: int | None = None,
+    use_cache: bool = True,
+    log_context: dict[str, Any] | None = None,
+) -> BridgeResult:
     runner, resolved = resolve_runner(model_name)
+    use_cache = use_cache and BRIDGE_CACHE_TTL > 0
+    cache_key = response_cache_key(runner, resolved, prompt) if use_cache else ""
+    if use_cache:
+        cached = response_cache_get(cache_key)
+        if cached is not None:
+            return replace(cached, cache_hit=True)
+
     if runner == "codex":
-        return run_codex(prompt, resolved, timeout_seconds=timeout_seconds)
-    return run_gemini(prompt, resolved, timeout_seconds=timeout_seconds)
+        result = run_codex(prompt, resolved, timeout_seconds=timeout_seconds, log_context=log_context)
+    else:
+        result = run_gemini(prompt, resolved, timeout_seconds=timeout_seconds)
+
+    if use_cache:
+        response_cache_put(cache_key, result)
+    return result
+
+
+class ModelStream:
+    """Iterates answer text for one request as it becomes available.
+
+    Codex output is forwarded per agent message event and Gemini CLI output per
+    line; Gemini API answers and cache hits are replayed line by line.
+    `result` is set once iteration completes.
+    """
+
+    __slots__ = ("runner", "resolved", "prompt", "use_cache", "log_context", "result")
+
+    def __init__(
+        self,
+        model_name: str,
+        prompt: str,
+        use_cache: bool = True,
+        log_context: dict[str, Any] | None = None,
+    ) -> None:
+        self.runner, self.resolved = resolve_runner(model_name)
+        self.prompt = prompt
+        self.use_cache = use_cache and BRIDGE_CACHE_TTL > 0
+        self.log_context = log_context
+        self.result: BridgeResult | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        cache_key = response_cache_key(self.runner, self.resolved, self.prompt, stream=True) if self.use_cache else ""
+        if self.use_cache:
+            cached = response_cache_get(cache_key)
+            if cached is not None:
+                self.result = replace(cached, cache_hit=True)
+                yield from self._replay(cached.text)
+                return
+
+        if self.runner == "codex":
+            codex_pieces: list[str] = []
+            for piece in iter_codex_text_deltas(stream_codex(self.prompt, self.resolved, log_context=self.log_context)):
+                codex_pieces.append(piece)
+                yield piece
+            answer = "".join(codex_pieces)
+            if not answer:
+                raise RuntimeError("No assistant message found in codex output")
+            result = BridgeResult(text=answer)
+        elif gemini_auth_mode == "api":
+            result = run_gemini_api(self.prompt, self.resolved)
+            yield from self._replay(result.text)
+        else:
+            pieces: list[str] = []
+            for piece in stream_gemini_cli(self.prompt, self.resolved):
+                pieces.append(piece)
+                yield piece
+            answer = "".join(pieces)
+            if not answer:
+                raise RuntimeError("No assistant message found in gemini output")
+            result = BridgeResult(text=answer)
+
+        if self.use_cache:
+            response_cache_put(cache_key, result)
+        self.result = result
+
+    @staticmethod
+    def _replay(text: str) -> Iterator[str]:
+        delay_seconds = BRIDGE_STREAM_DELAY_MS / 1000
+        for piece in iter_text_chunks(text, BRIDGE_STREAM_REPLAY_CHARS):
+            yield piece
+            if delay_seconds:
+                time.sleep(delay_seconds)
 
 
 def startup_probe(model_name: str, timeout_seconds: int) -> tuple[bool, str]:
     probe_prompt = "Reply with one short word only: OK"
     try:
-        result = run_model(model_name, probe_prompt, timeout_seconds=timeout_seconds)
+        result = run_model(model_name, probe_prompt, timeout_seconds=timeout_seconds, use_cache=False)
     except Exception as exc:
         return False, str(exc)
     preview = result.text.strip().replace("\n", " ")
@@ -321,40 +1031,50 @@ def startup_probe(model_name: str, timeout_seconds: int) -> tuple[bool, str]:
     return True, preview
 
 
-def load_settings() -> dict[str, Any]:
+json_file_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def load_json_file_cached(path: str) -> dict[str, Any]:
     try:
-        with open(SETTINGS_FILE_PATH, "r", encoding="utf-8") as fp:
-            loaded = json.load(fp)
-        if isinstance(loaded, dict):
-            return loaded
-    except FileNotFoundError:
+        st = os.stat(path)
+    except OSError:
+        json_file_cache.pop(path, None)
         return {}
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = json_file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    try:
+        with open(path, "rb") as fp:
+            loaded = json_loads(fp.read())
     except Exception:
         return {}
-    return {}
+    if not isinstance(loaded, dict):
+        return {}
+    json_file_cache[path] = (signature, loaded)
+    return dict(loaded)
+
+
+def save_json_file(path: str, data: dict[str, Any]) -> None:
+    json_file_cache.pop(path, None)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(data, fp, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def load_settings() -> dict[str, Any]:
+    return load_json_file_cached(SETTINGS_FILE_PATH)
 
 
 def save_settings(settings: dict[str, Any]) -> None:
-    with open(SETTINGS_FILE_PATH, "w", encoding="utf-8") as fp:
-        json.dump(settings, fp, ensure_ascii=False, indent=2, sort_keys=True)
+    save_json_file(SETTINGS_FILE_PATH, settings)
 
 
 def load_secrets() -> dict[str, Any]:
-    try:
-        with open(SECRETS_FILE_PATH, "r", encoding="utf-8") as fp:
-            loaded = json.load(fp)
-        if isinstance(loaded, dict):
-            return loaded
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        return {}
-    return {}
+    return load_json_file_cached(SECRETS_FILE_PATH)
 
 
 def save_secrets(secrets: dict[str, Any]) -> None:
-    with open(SECRETS_FILE_PATH, "w", encoding="utf-8") as fp:
-        json.dump(secrets, fp, ensure_ascii=False, indent=2, sort_keys=True)
+    save_json_file(SECRETS_FILE_PATH, secrets)
 
 
 def choose_gemini_auth_mode_interactive(default_mode: str) -> str:
@@ -422,60 +1142,202 @@ def ensure_api_key_for_gemini_if_needed(mode: str) -> None:
         save_secrets(secrets)
 
 
-def json_response(handler: BaseHTTPRequestHandler, code: int, payload: dict[str, Any]) -> None:
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+def json_response(
+    handler: BaseHTTPRequestHandler,
+    code: int,
+    payload: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> None:
+    raw_json_response(handler, code, json_dumps_bytes(payload), headers)
+
+
+def raw_json_response(
+    handler: BaseHTTPRequestHandler,
+    code: int,
+    data: bytes,
+    headers: dict[str, str] | None = None,
+) -> None:
     handler.send_response(code)
     handler.send_header("Content-Type", "application/json; charset=utf-8")
     handler.send_header("Content-Length", str(len(data)))
+    handler.send_header("Connection", "close" if handler.close_connection else "keep-alive")
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
     handler.end_headers()
     handler.wfile.write(data)
 
 
-def print_pretty_json(payload: dict[str, Any]) -> None:
-    full_rendered = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
-    console_rendered = json.dumps(
-        truncate_for_console(payload, CONSOLE_LOG_VALUE_MAX_CHARS),
-        ensure_ascii=False,
-        indent=2,
-        sort_keys=True,
-    )
-    print(console_rendered, flush=True)
+get_response_cache: dict[str, tuple[int, dict[str, Any], bytes]] = {}
+
+
+def cached_get_response(path: str, build: Callable[[], dict[str, Any]]) -> tuple[dict[str, Any], bytes]:
+    # Polled GET payloads only carry second-level timestamps worth refreshing,
+    # so the encoded body is rebuilt at most once per second.
+    second = time.time_ns() // 1_000_000_000
+    cached = get_response_cache.get(path)
+    if cached is not None and cached[0] == second:
+        return cached[1], cached[2]
+    payload = build()
+    data = json_dumps_bytes(payload)
+    get_response_cache[path] = (second, payload, data)
+    return payload, data
+
+
+def event_log_level(event: str, status: int = 0) -> int:
+    if status >= 400 or event.endswith(LOG_ERROR_EVENT_SUFFIXES):
+        return LOG_LEVELS["error"]
+    return LOG_LEVELS["info"]
+
+
+def log_json_event(payload: dict[str, Any], level: int) -> None:
+    if level < BRIDGE_LOG_LEVEL:
+        return
+    console_payload = truncate_for_console(payload, CONSOLE_LOG_VALUE_MAX_CHARS)
+    if BRIDGE_LOG_PRETTY:
+        full_rendered = json_dumps_pretty(payload)
+        console_rendered = json_dumps_pretty(console_payload)
+    else:
+        full_rendered = json_dumps_bytes(payload).decode("utf-8")
+        console_rendered = full_rendered if console_payload is payload else json_dumps_bytes(console_payload).decode("utf-8")
+    print(console_rendered)
     append_log_text(full_rendered)
 
 
+STREAM_TEMPLATE_PIECE = "\x00piece\x00"
+
+
+def build_stream_chunk_template(
+    model: str,
+    created_at: str,
+    content_fields: Callable[[str], dict[str, Any]],
+) -> tuple[bytes, bytes]:
+    """Pre-encodes a `done: false` stream line as the bytes before and after its piece."""
+    encoded = json_dumps_bytes(
+        {
+            "model": model,
+            "created_at": created_at,
+            **content_fields(STREAM_TEMPLATE_PIECE),
+            "done": False,
+        }
+    )
+    prefix, suffix = encoded.split(json_dumps_bytes(STREAM_TEMPLATE_PIECE), 1)
+    return prefix, suffix
+
+
+class NDJSONStreamWriter:
+    """Buffers NDJSON lines and sends them every `flush_every` lines or `flush_bytes` bytes."""
+
+    __slots__ = ("wfile", "flush_every", "flush_bytes", "buffer", "pending")
+
+    def __init__(self, wfile: Any, flush_every: int, flush_bytes: int) -> None:
+        self.wfile = wfile
+        self.flush_every = flush_every
+        self.flush_bytes = flush_bytes
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def write(self, payload: dict[str, Any]) -> None:
+        self.write_line(json_dumps_bytes(payload))
+
+    def write_line(self, line: bytes) -> None:
+        self.buffer += line
+        self.buffer += b"\n"
+        self.pending += 1
+        if self.pending >= self.flush_every or len(self.buffer) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.wfile.write(self.buffer)
+            self.buffer.clear()
+        self.pending = 0
+        self.wfile.flush()
+
+
+# /api/tags entries only differ per call in modified_at, which replaces the
+# placeholder in place so the key order stays the same.
+TAGS_MODEL_ENTRIES = tuple(
+    {
+        "name": name,
+        "model": name,
+        "modified_at": "",
+        "size": 0,
+        "digest": f"{name}-bridge",
+        "details": {
+            "parent_model": "",
+            "format": "bridge",
+            "family": name,
+            "families": [name],
+            "parameter_size": "unknown",
+            "quantization_level": "none",
+        },
+    }
+    for name in ("codex", "gemini")
+)
+# Request ids stay 8 hex chars: a per-process prefix plus a counter, which is
+# unique enough to correlate log lines without drawing random bytes.
+REQUEST_ID_PREFIX = f"{(os.getpid() ^ int(time.time())) & 0xFF:02x}"
+REQUEST_ID_COUNTER = itertools.count(1)
+
+
 class BridgeHandler(BaseHTTPRequestHandler):
     server_version = "CodexOllamaBridge/0.1"
+    timeout = BRIDGE_READ_TIMEOUT_SECONDS if BRIDGE_READ_TIMEOUT_SECONDS > 0 else None
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
     _bridge_request_id: str = ""
+    _awaiting_request_line = False
+
+    def handle_one_request(self) -> None:
+        # Keep-alive connections reuse the handler, so each request gets a new id.
+        self._bridge_request_id = ""
+        # An idle connection holds a worker thread, so waiting for the next request
+        # line uses the short keep-alive timeout; parse_request restores the read timeout.
+        self._awaiting_request_line = True
+        if BRIDGE_KEEPALIVE_TIMEOUT_SECONDS > 0:
+            self.connection.settimeout(BRIDGE_KEEPALIVE_TIMEOUT_SECONDS)
+        super().handle_one_request()
+
+    def parse_request(self) -> bool:
+        self._awaiting_request_line = False
+        self.connection.settimeout(self.timeout)
+        return super().parse_request()
 
     def _request_id(self) -> str:
         current = getattr(self, "_bridge_request_id", "")
         if current:
             return current
-        generated = uuid.uuid4().hex[:8]
+        generated = f"{REQUEST_ID_PREFIX}{next(REQUEST_ID_COUNTER) & 0xFFFFFF:06x}"
         self._bridge_request_id = generated
         return generated
 
     def _log(self, event: str, **fields: Any) -> None:
-        payload = {
-            "ts": now_iso(),
-            "request_id": self._request_id(),
-            "method": self.command,
-            "path": self.path,
-            "event": event,
-            **fields,
-        }
-        print_pretty_json(payload)
+        level = event_log_level(event, fields.get("status", 0))
+        if level < BRIDGE_LOG_LEVEL:
+            return
+        payload = {"ts": now_iso(), **self._log_context(), "event": event, **fields}
+        log_json_event(payload, level)
+
+    def _log_context(self) -> dict[str, Any]:
+        return {"request_id": self._request_id(), "method": self.command, "path": self.path}
+
+    def _has_request_body(self) -> bool:
+        return "Transfer-Encoding" in self.headers or self.headers.get("Content-Length", "0").strip() not in {"", "0"}
 
     def do_GET(self) -> None:  # noqa: N802
+        # GET bodies are never read; leftover bytes must not be parsed as the next request.
+        if self._has_request_body():
+            self.close_connection = True
+
         if self.path == "/healthz":
-            payload = {"ok": True, "time": now_iso()}
-            json_response(self, HTTPStatus.OK, payload)
+            payload, data = cached_get_response(self.path, lambda: {"ok": True, "time": now_iso()})
+            raw_json_response(self, HTTPStatus.OK, data)
             self._log("response.sent", status=int(HTTPStatus.OK), response=payload)
             return
 
         if self.path == "/api/tags":
-            payload = self.tags_payload()
-            json_response(self, HTTPStatus.OK, payload)
+            payload, data = cached_get_response(self.path, self.tags_payload)
+            raw_json_response(self, HTTPStatus.OK, data)
             self._log("response.sent", status=int(HTTPStatus.OK), response=payload)
             return
 
@@ -484,33 +1346,51 @@ class BridgeHandler(BaseHTTPRequestHandler):
         self._log("response.sent", status=int(HTTPStatus.NOT_FOUND), response=payload)
 
     def tags_payload(self) -> dict[str, Any]:
-        model_names = ["codex", "gemini"]
-        return {
-            "models": [
-                {
-                    "name": name,
-                    "model": name,
-                    "modified_at": now_iso(),
-                    "size": 0,
-                    "digest": f"{name}-bridge",
-                    "details": {
-                        "parent_model": "",
-                        "format": "bridge",
-                        "family": name,
-                        "families": [name],
-                        "parameter_size": "unknown",
-                        "quantization_level": "none",
-                    },
-                }
-                for name in model_names
-            ]
-        }
+        modified_at = now_iso()
+        return {"models": [{**entry, "modified_at": modified_at} for entry in TAGS_MODEL_ENTRIES]}
 
     def do_POST(self) -> None:  # noqa: N802
+        if "Transfer-Encoding" in self.headers:
+            error_payload = {"error": "Content-Length is required; chunked request bodies are not supported"}
+            self.close_connection = True
+            json_response(self, HTTPStatus.LENGTH_REQUIRED, error_payload)
+            self._log("response.sent", status=int(HTTPStatus.LENGTH_REQUIRED), response=error_payload)
+            return
         try:
             content_length = int(self.headers.get("Content-Length", "0"))
-            body = self.rfile.read(content_length) if content_length else b"{}"
-            payload = json.loads(body.decode("utf-8"))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            error_payload = {"error": "Invalid Content-Length"}
+            self.close_connection = True
+            json_response(self, HTTPStatus.BAD_REQUEST, error_payload)
+            self._log("response.sent", status=int(HTTPStatus.BAD_REQUEST), response=error_payload)
+            return
+        if content_length > BRIDGE_MAX_BODY_BYTES:
+            error_payload = {"error": f"Request body exceeds {BRIDGE_MAX_BODY_BYTES} bytes"}
+            self.close_connection = True
+            json_response(self, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, error_payload)
+            self._log("response.sent", status=int(HTTPStatus.REQUEST_ENTITY_TOO_LARGE), response=error_payload)
+            return
+
+        try:
+            body = self.read_body(content_length) if content_length else b"{}"
+        except TimeoutError:
+            self.close_connection = True
+            self._log("request.read_timeout", content_length=content_length)
+            error_payload = {"error": "Timed out reading request body"}
+            try:
+                json_response(self, HTTPStatus.REQUEST_TIMEOUT, error_payload)
+            except OSError:
+                return
+            self._log("response.sent", status=int(HTTPStatus.REQUEST_TIMEOUT), response=error_payload)
+            return
+        if len(body) < content_length:
+            # The client sent less than it declared; the connection cannot be reused.
+            self.close_connection = True
+
+        try:
+            payload = json_loads(body)
         except (ValueError, json.JSONDecodeError):
             self._log("request.invalid_json")
             error_payload = {"error": "Invalid JSON body"}
@@ -530,10 +1410,22 @@ class BridgeHandler(BaseHTTPRequestHandler):
         json_response(self, HTTPStatus.NOT_FOUND, error_payload)
         self._log("response.sent", status=int(HTTPStatus.NOT_FOUND), response=error_payload)
 
+    def read_body(self, content_length: int) -> bytearray:
+        # Bounded reads: memory follows the bytes that arrive, not the size a
+        # client declares.
+        body = bytearray()
+        while len(body) < content_length:
+            chunk = self.rfile.read1(min(REQUEST_BODY_READ_CHUNK_BYTES, content_length - len(body)))
+            if not chunk:
+                break
+            body += chunk
+        return body
+
     def handle_chat(self, payload: dict[str, Any]) -> None:
         model = str(payload.get("model", BRIDGE_MODEL_NAME))
         messages = payload.get("messages", [])
         stream = bool(payload.get("stream", False))
+        use_cache = bool(payload.get("cache", True))
 
         self._log("chat.start", request=payload)
 
@@ -543,55 +1435,40 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._log("chat.error", status=int(HTTPStatus.BAD_REQUEST), error=error_payload["error"])
             return
 
+        prompt = build_prompt_from_messages(messages)
+        if stream:
+            self.stream_model_response(
+                "chat",
+                model,
+                prompt,
+                use_cache,
+                lambda piece: {"message": {"role": "assistant", "content": piece}},
+            )
+            return
+
         try:
-            result = run_model(model, build_prompt_from_messages(messages))
+            result = run_model(model, prompt, use_cache=use_cache, log_context=self._log_context())
         except ValueError as exc:
             error_payload = {"error": str(exc)}
             json_response(self, HTTPStatus.BAD_REQUEST, error_payload)
             self._log("chat.error", status=int(HTTPStatus.BAD_REQUEST), error=str(exc))
             return
+        except BridgeBusyError as exc:
+            error_payload = {"error": str(exc)}
+            json_response(
+                self,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                error_payload,
+                headers={"Retry-After": str(BRIDGE_RETRY_AFTER_SECONDS)},
+            )
+            self._log("chat.error", status=int(HTTPStatus.SERVICE_UNAVAILABLE), error=str(exc))
+            return
         except Exception as exc:
             error_payload = {"error": str(exc)}
             json_response(self, HTTPStatus.BAD_GATEWAY, error_payload)
             self._log("chat.error", status=int(HTTPStatus.BAD_GATEWAY), error=str(exc))
             return
 
-        if stream:
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
-            self.end_headers()
-            chunks = 0
-            chars = 0
-            for piece in chunk_text(result.text):
-                chunks += 1
-                chars += len(piece)
-                chunk = {
-                    "model": model,
-                    "created_at": now_iso(),
-                    "message": {"role": "assistant", "content": piece},
-                    "done": False,
-                }
-                self.wfile.write((json.dumps(chunk, ensure_ascii=False) + "\n").encode("utf-8"))
-                self.wfile.flush()
-                time.sleep(0.01)
-            done = {
-                "model": model,
-                "created_at": now_iso(),
-                "message": {"role": "assistant", "content": ""},
-                "done": True,
-                "done_reason": "stop",
-            }
-            self.wfile.write((json.dumps(done, ensure_ascii=False) + "\n").encode("utf-8"))
-            self.wfile.flush()
-            self._log(
-                "chat.stream.done",
-                status=int(HTTPStatus.OK),
-                chunks=chunks,
-                chars=chars,
-                response_text=result.text,
-            )
-            return
-
         response = {
             "model": model,
             "created_at": now_iso(),
@@ -604,6 +1481,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
         self._log(
             "chat.done",
             status=int(HTTPStatus.OK),
+            cache=cache_status(result, use_cache),
             response=response,
         )
 
@@ -612,6 +1490,7 @@ class BridgeHandler(BaseHTTPRequestHandler):
         prompt = str(payload.get("prompt", "")).strip()
         system = str(payload.get("system", "")).strip()
         stream = bool(payload.get("stream", False))
+        use_cache = bool(payload.get("cache", True))
 
         self._log("generate.start", request=payload)
 
@@ -621,63 +1500,35 @@ class BridgeHandler(BaseHTTPRequestHandler):
             self._log("generate.error", status=int(HTTPStatus.BAD_REQUEST), error=error_payload["error"])
             return
 
-        prompt_parts: list[str] = []
-        if DETAIL_MODE != "off" and DETAIL_SYSTEM_INSTRUCTION:
-            prompt_parts.append(f"[SYSTEM] {DETAIL_SYSTEM_INSTRUCTION}")
-        if system:
-            prompt_parts.append(f"[SYSTEM] {system}")
-        prompt_parts.append(f"[USER] {prompt}")
-        full_prompt = "\n".join(prompt_parts)
+        full_prompt = build_prompt_from_generate(prompt, system)
+
+        if stream:
+            self.stream_model_response("generate", model, full_prompt, use_cache, lambda piece: {"response": piece})
+            return
 
         try:
-            result = run_model(model, full_prompt)
+            result = run_model(model, full_prompt, use_cache=use_cache, log_context=self._log_context())
         except ValueError as exc:
             error_payload = {"error": str(exc)}
             json_response(self, HTTPStatus.BAD_REQUEST, error_payload)
             self._log("generate.error", status=int(HTTPStatus.BAD_REQUEST), error=str(exc))
             return
+        except BridgeBusyError as exc:
+            error_payload = {"error": str(exc)}
+            json_response(
+                self,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                error_payload,
+                headers={"Retry-After": str(BRIDGE_RETRY_AFTER_SECONDS)},
+            )
+            self._log("generate.error", status=int(HTTPStatus.SERVICE_UNAVAILABLE), error=str(exc))
+            return
         except Exception as exc:
             error_payload = {"error": str(exc)}
             json_response(self, HTTPStatus.BAD_GATEWAY, error_payload)
             self._log("generate.error", status=int(HTTPStatus.BAD_GATEWAY), error=str(exc))
             return
 
-        if stream:
-            self.send_response(HTTPStatus.OK)
-            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
-            self.end_headers()
-            chunks = 0
-            chars = 0
-            for piece in chunk_text(result.text):
-                chunks += 1
-                chars += len(piece)
-                chunk = {
-                    "model": model,
-                    "created_at": now_iso(),
-                    "response": piece,
-                    "done": False,
-                }
-                self.wfile.write((json.dumps(chunk, ensure_ascii=False) + "\n").encode("utf-8"))
-                self.wfile.flush()
-                time.sleep(0.01)
-            done = {
-                "model": model,
-                "created_at": now_iso(),
-                "response": "",
-                "done": True,
-                "done_reason": "stop",
-            }
-            self.wfile.write((json.dumps(done, ensure_ascii=False) + "\n").encode("utf-8"))
-            self.wfile.flush()
-            self._log(
-                "generate.stream.done",
-                status=int(HTTPStatus.OK),
-                chunks=chunks,
-                chars=chars,
-                response_text=result.text,
-            )
-            return
-
         response = {
             "model": model,
             "created_at": now_iso(),
@@ -690,29 +1541,196 @@ class BridgeHandler(BaseHTTPRequestHandler):
         self._log(
             "generate.done",
             status=int(HTTPStatus.OK),
+            cache=cache_status(result, use_cache),
             response=response,
         )
 
+    def stream_model_response(
+        self,
+        event_prefix: str,
+        model: str,
+        prompt: str,
+        use_cache: bool,
+        content_fields: Callable[[str], dict[str, Any]],
+    ) -> None:
+        try:
+            model_stream = ModelStream(model, prompt, use_cache=use_cache, log_context=self._log_context())
+            pieces = iter(model_stream)
+            first_piece = next(pieces, None)
+        except ValueError as exc:
+            error_payload = {"error": str(exc)}
+            json_response(self, HTTPStatus.BAD_REQUEST, error_payload)
+            self._log(f"{event_prefix}.error", status=int(HTTPStatus.BAD_REQUEST), error=str(exc))
+            return
+        except BridgeBusyError as exc:
+            error_payload = {"error": str(exc)}
+            json_response(
+                self,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                error_payload,
+                headers={"Retry-After": str(BRIDGE_RETRY_AFTER_SECONDS)},
+            )
+            self._log(f"{event_prefix}.error", status=int(HTTPStatus.SERVICE_UNAVAILABLE), error=str(exc))
+            return
+        except Exception as exc:
+            error_payload = {"error": str(exc)}
+            json_response(self, HTTPStatus.BAD_GATEWAY, error_payload)
+            self._log(f"{event_prefix}.error", status=int(HTTPStatus.BAD_GATEWAY), error=str(exc))
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        # Streams have no Content-Length, so the connection ends with the body.
+        self.send_header("Connection", "close")
+        self.end_headers()
+        writer = NDJSONStreamWriter(self.wfile, BRIDGE_STREAM_FLUSH_EVERY, BRIDGE_STREAM_FLUSH_BYTES)
+        # Chunk lines share the response's created_at, so only the piece is encoded per line.
+        prefix, suffix = build_stream_chunk_template(model, now_iso(), content_fields)
+        chunks = 0
+        chars = 0
+        try:
+            piece = first_piece
+            while piece is not None:
+                chunks += 1
+                chars += len(piece)
+                writer.write_line(prefix + json_dumps_bytes(piece) + suffix)
+                piece = next(pieces, None)
+            writer.write(
+                {
+                    "model": model,
+                    "created_at": now_iso(),
+                    **content_fields(""),
+                    "done": True,
+                    "done_reason": "stop",
+                }
+            )
+            writer.flush()
+        except OSError as exc:
+            pieces.close()
+            self._log(f"{event_prefix}.stream.aborted", chunks=chunks, chars=chars, error=str(exc))
+            return
+        except Exception as exc:
+            try:
+                writer.write({"error": str(exc)})
+                writer.flush()
+            except OSError:
+                pass
+            self._log(f"{event_prefix}.error", status=int(HTTPStatus.BAD_GATEWAY), chunks=chunks, error=str(exc))
+            return
+
+        result = model_stream.result or BridgeResult(text="")
+        # The text was already streamed; only debug logs repeat it.
+        extra_fields = {"response_text": result.text} if BRIDGE_LOG_LEVEL <= LOG_LEVELS["debug"] else {}
+        self._log(
+            f"{event_prefix}.stream.done",
+            status=int(HTTPStatus.OK),
+            chunks=chunks,
+            chars=chars,
+            cache=cache_status(result, use_cache),
+            **extra_fields,
+        )
+
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        if BRIDGE_LOG_LEVEL <= LOG_LEVELS["info"]:
+            super().log_request(code, size)
+
+    def log_error(self, format: str, *args: Any) -> None:
+        # Idle keep-alive connections timing out is routine, not an error.
+        if self._awaiting_request_line and format.startswith("Request timed out"):
+            return
+        if BRIDGE_LOG_LEVEL <= LOG_LEVELS["error"]:
+            super().log_error(format, *args)
+
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
-        request_id = uuid.uuid4().hex[:8]
-        log_line(f"[{now_iso()}] [{request_id}] {self.address_string()} - {format % args}")
+        log_line(f"[{now_iso()}] [{self._request_id()}] {self.address_string()} - {format % args}")
 
 
 class ReusableThreadingHTTPServer(ThreadingHTTPServer):
+    """Serves connections on a bounded worker pool instead of a thread per connection."""
+
     allow_reuse_address = True
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._request_slots = threading.BoundedSemaphore(BRIDGE_WORKERS + BRIDGE_MAX_PENDING)
+        self._pending_requests: queue.Queue[tuple[Any, Any] | None] = queue.Queue()
+        # Daemon workers, so Ctrl+C does not wait for open keep-alive or streaming connections.
+        for index in range(BRIDGE_WORKERS):
+            threading.Thread(target=self._worker_loop, name=f"bridge-worker-{index}", daemon=True).start()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        if not self._request_slots.acquire(blocking=False):
+            self.reject_request(request, client_address)
+            return
+        self._pending_requests.put((request, client_address))
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._pending_requests.get()
+            if item is None:
+                return
+            try:
+                self.process_request_thread(*item)
+            finally:
+                self._request_slots.release()
+
+    def reject_request(self, request: Any, client_address: Any) -> None:
+        body = json_dumps_bytes({"error": "Server is busy"})
+        head = (
+            "HTTP/1.1 503 Service Unavailable\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Retry-After: {BRIDGE_RETRY_AFTER_SECONDS}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            request.sendall(head.encode("ascii") + body)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+        log_json_event(
+            {
+                "ts": now_iso(),
+                "client": str(client_address[0]) if client_address else "",
+                "event": "request.rejected",
+                "status": int(HTTPStatus.SERVICE_UNAVAILABLE),
+            },
+            LOG_LEVELS["error"],
+        )
+
+    def server_close(self) -> None:
+        super().server_close()
+        while True:
+            try:
+                item = self._pending_requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in range(BRIDGE_WORKERS):
+            self._pending_requests.put(None)
+
 
 def main() -> None:
-    global active_log_file_path, gemini_auth_mode
+    global active_log_file_path, gemini_auth_mode, response_disk_cache
+
+    # Every console write ends in a newline, so line buffering flushes each
+    # log line once without a per-call flush.
+    for stream in (sys.stdout, sys.stderr):
+        reconfigure = getattr(stream, "reconfigure", None)
+        if reconfigure is not None:
+            reconfigure(line_buffering=True)
 
     host = "0.0.0.0"
     port = DEFAULT_PORT
     os.makedirs(LOG_DIR_PATH, exist_ok=True)
     start_name = datetime.now(KST).strftime("bridge_server-%Y%m%d-%H%M%S.log")
     active_log_file_path = os.path.join(LOG_DIR_PATH, start_name)
+    start_log_writer()
 
     gemini_auth_mode = ensure_gemini_auth_mode()
     ensure_api_key_for_gemini_if_needed(gemini_auth_mode)
+    refresh_subprocess_envs()
 
     log_line(f"[{now_iso()}] Starting bridge on http://{host}:{port}")
     log_line(f"[{now_iso()}] Log file: {active_log_file_path}")
@@ -721,23 +1739,49 @@ def main() -> None:
     log_line(f"[{now_iso()}] Using gemini binary: {GEMINI_BIN}")
     log_line(f"[{now_iso()}] Using model verbosity: {CODEX_MODEL_VERBOSITY or 'default'}")
     log_line(f"[{now_iso()}] Detail mode: {DETAIL_MODE}")
+    if CODEX_WORKER_CWD:
+        os.makedirs(CODEX_WORKER_CWD, exist_ok=True)
+        log_line(f"[{now_iso()}] Codex working directory: {CODEX_WORKER_CWD}")
+    codex_pool.start()
+    log_line(f"[{now_iso()}] Codex worker pool: {codex_pool.size}")
+    if BRIDGE_CACHE_TTL > 0:
+        try:
+            response_disk_cache = open_response_disk_cache()
+            log_line(f"[{now_iso()}] Response cache: {CACHE_DB_FILE_PATH} (ttl {BRIDGE_CACHE_TTL}s)")
+        except sqlite3.Error as exc:
+            log_line(f"[{now_iso()}] Response cache: memory only ({exc})")
+    else:
+        log_line(f"[{now_iso()}] Response cache: off")
+
+    if STARTUP_PROBE_SKIP:
+        log_line(f"[{now_iso()}] Startup AI readiness checks skipped (STARTUP_PROBE_SKIP)")
+    else:
+        checks = ["codex", "gemini"]
+        check_results: dict[str, tuple[bool, str]] = {}
+        log_line(f"[{now_iso()}] Running startup AI readiness checks...")
+        with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="startup-probe") as executor:
+            futures = {
+                name: executor.submit(startup_probe, name, timeout_seconds=STARTUP_CHECK_TIMEOUT_SECONDS)
+                for name in checks
+            }
+        for name, future in futures.items():
+            ok, detail = future.result()
+            check_results[name] = (ok, detail)
+            if ok:
+                log_line(f"[{now_iso()}] [READY] {name}: {detail}")
+            else:
+                log_line(f"[{now_iso()}] [FAIL ] {name}: {detail}")
 
-    checks = ["codex", "gemini"]
-    check_results: dict[str, tuple[bool, str]] = {}
-    log_line(f"[{now_iso()}] Running startup AI readiness checks...")
-    for name in checks:
-        ok, detail = startup_probe(name, timeout_seconds=STARTUP_CHECK_TIMEOUT_SECONDS)
-        check_results[name] = (ok, detail)
-        if ok:
-            log_line(f"[{now_iso()}] [READY] {name}: {detail}")
-        else:
-            log_line(f"[{now_iso()}] [FAIL ] {name}: {detail}")
-
-    if STARTUP_CHECK_STRICT and any(not ok for ok, _ in check_results.values()):
-        raise RuntimeError("Startup readiness checks failed and STARTUP_CHECK_STRICT is enabled")
+        if STARTUP_CHECK_STRICT and any(not ok for ok, _ in check_results.values()):
+            raise RuntimeError("Startup readiness checks failed and STARTUP_CHECK_STRICT is enabled")
 
     server = ReusableThreadingHTTPServer((host, port), BridgeHandler)
-    server.serve_forever()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log_line(f"[{now_iso()}] Shutting down")
+    finally:
+        server.server_close()
 
 
 if __name__ == "__main__":